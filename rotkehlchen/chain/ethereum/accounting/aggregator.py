@@ -2,8 +2,9 @@ import importlib
 import logging
 import pkgutil
 from types import ModuleType
-from typing import TYPE_CHECKING, Dict, Union
+from typing import TYPE_CHECKING, ClassVar, Dict, Final, List, Optional, Tuple, Type, Union
 
+from rotkehlchen.accounting.structures.base import get_tx_event_type_identifier
 from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.chain.ethereum.constants import MODULES_PACKAGE, MODULES_PREFIX_LENGTH
 from rotkehlchen.chain.ethereum.decoding.constants import CPT_GAS
@@ -23,8 +24,58 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Keys and settings of the default event settings. The event settings are immutable
+# and apart from the gas settings do not depend on the pot, so they are created once.
+GAS_SETTINGS_KEY: Final = get_tx_event_type_identifier(
+    HistoryEventType.SPEND,
+    HistoryEventSubType.FEE,
+    CPT_GAS,
+)
+SPEND_SETTINGS_KEY: Final = str(HistoryEventType.SPEND) + '__' + str(HistoryEventSubType.NONE)
+RECEIVE_SETTINGS_KEY: Final = str(HistoryEventType.RECEIVE) + '__' + str(HistoryEventSubType.NONE)  # noqa: E501
+DEPOSIT_SETTINGS_KEY: Final = str(HistoryEventType.DEPOSIT) + '__' + str(HistoryEventSubType.NONE)  # noqa: E501
+WITHDRAWAL_SETTINGS_KEY: Final = str(HistoryEventType.WITHDRAWAL) + '__' + str(HistoryEventSubType.NONE)  # noqa: E501
+SPEND_SETTINGS: Final = TxEventSettings(
+    taxable=True,
+    count_entire_amount_spend=True,
+    count_cost_basis_pnl=True,
+    take=1,
+    method='spend',
+)
+RECEIVE_SETTINGS: Final = TxEventSettings(
+    taxable=True,
+    count_entire_amount_spend=True,
+    count_cost_basis_pnl=True,
+    take=1,
+    method='acquisition',
+)
+DEPOSIT_SETTINGS: Final = TxEventSettings(
+    taxable=False,
+    count_entire_amount_spend=False,
+    count_cost_basis_pnl=False,
+    take=1,
+    method='spend',
+)
+WITHDRAWAL_SETTINGS: Final = TxEventSettings(
+    taxable=False,
+    count_entire_amount_spend=False,
+    count_cost_basis_pnl=False,
+    take=1,
+    method='acquisition',
+)
+# Default settings that do not depend on the pot, merged into the result in one go
+STATIC_DEFAULT_SETTINGS: Final = {
+    SPEND_SETTINGS_KEY: SPEND_SETTINGS,
+    RECEIVE_SETTINGS_KEY: RECEIVE_SETTINGS,
+    DEPOSIT_SETTINGS_KEY: DEPOSIT_SETTINGS,
+    WITHDRAWAL_SETTINGS_KEY: WITHDRAWAL_SETTINGS,
+}
+
 
 class EVMAccountingAggregator():
+    # Accountant classes found in the modules package. Discovered once and shared by
+    # all instances so that the package walk and the imports are not repeated per instance
+    accountant_classes: ClassVar[Optional[List[Tuple[str, Type['ModuleAccountantInterface']]]]] = None  # noqa: E501
 
     def __init__(
             self,
@@ -36,11 +87,14 @@ class EVMAccountingAggregator():
         self.accountants: Dict[str, 'ModuleAccountantInterface'] = {}
         self.initialize_all_accountants()
 
-    def _recursively_initialize_accountants(
-            self, package: Union[str, ModuleType],
-    ) -> None:
+    @classmethod
+    def _recursively_find_accountants(
+            cls,
+            package: Union[str, ModuleType],
+    ) -> List[Tuple[str, Type['ModuleAccountantInterface']]]:
         if isinstance(package, str):
             package = importlib.import_module(package)
+        results = []
         for _, name, is_pkg in pkgutil.walk_packages(package.__path__):
             full_name = package.__name__ + '.' + name
             if full_name == __name__:
@@ -52,69 +106,47 @@ class EVMAccountingAggregator():
                 submodule_accountant = getattr(submodule, f'{class_name.capitalize()}Accountant', None)  # noqa: E501
 
                 if submodule_accountant:
-                    if class_name in self.accountants:
-                        raise ModuleLoadingError(f'Accountant with name {class_name} already loaded')  # noqa: E501
-                    self.accountants[class_name] = submodule_accountant(
-                        ethereum_manager=self.ethereum_manager,
-                        msg_aggregator=self.msg_aggregator,
-                    )
+                    results.append((class_name, submodule_accountant))
+
+                results.extend(cls._recursively_find_accountants(full_name))
 
-                self._recursively_initialize_accountants(full_name)  # noqa: E501
+        return results
 
     def initialize_all_accountants(self) -> None:
-        """Recursively check all submodules to get all accountants and initialize them"""
-        self._recursively_initialize_accountants(MODULES_PACKAGE)  # noqa: E501
+        """Recursively check all submodules to get all accountants and initialize them
+
+        The submodules are only walked the first time an aggregator is initialized"""
+        if EVMAccountingAggregator.accountant_classes is None:
+            EVMAccountingAggregator.accountant_classes = self._recursively_find_accountants(MODULES_PACKAGE)  # noqa: E501
+
+        for class_name, accountant_class in EVMAccountingAggregator.accountant_classes:
+            if class_name in self.accountants:
+                raise ModuleLoadingError(f'Accountant with name {class_name} already loaded')
+            self.accountants[class_name] = accountant_class(
+                ethereum_manager=self.ethereum_manager,
+                msg_aggregator=self.msg_aggregator,
+            )
+        # accountants are not modified after initialization so iterate a tuple of them
+        self._accountants_tuple = tuple(self.accountants.values())
 
     def get_accounting_settings(self, pot: 'AccountingPot') -> Dict[str, TxEventSettings]:
         """Iterate through loaded accountants and get accounting settings for each event type"""
-        result = {}
-        for accountant in self.accountants.values():
+        result: Dict[str, TxEventSettings] = {}
+        for accountant in self._accountants_tuple:
             result.update(accountant.event_settings(pot))
 
         # Also add the default settings
-        gas_key = str(HistoryEventType.SPEND) + '__' + str(HistoryEventSubType.FEE) + '__' + CPT_GAS  # noqa: E501
-        result[gas_key] = TxEventSettings(
+        result.update(STATIC_DEFAULT_SETTINGS)
+        result[GAS_SETTINGS_KEY] = TxEventSettings(
             taxable=pot.settings.include_gas_costs,
             count_entire_amount_spend=True,
             count_cost_basis_pnl=True,
             take=1,
             method='spend',
         )
-        spend_key = str(HistoryEventType.SPEND) + '__' + str(HistoryEventSubType.NONE)
-        result[spend_key] = TxEventSettings(
-            taxable=True,
-            count_entire_amount_spend=True,
-            count_cost_basis_pnl=True,
-            take=1,
-            method='spend',
-        )
-        receive_key = str(HistoryEventType.RECEIVE) + '__' + str(HistoryEventSubType.NONE)
-        result[receive_key] = TxEventSettings(
-            taxable=True,
-            count_entire_amount_spend=True,
-            count_cost_basis_pnl=True,
-            take=1,
-            method='acquisition',
-        )
-        deposit_key = str(HistoryEventType.DEPOSIT) + '__' + str(HistoryEventSubType.NONE)
-        result[deposit_key] = TxEventSettings(
-            taxable=False,
-            count_entire_amount_spend=False,
-            count_cost_basis_pnl=False,
-            take=1,
-            method='spend',
-        )
-        withdraw_key = str(HistoryEventType.WITHDRAWAL) + '__' + str(HistoryEventSubType.NONE)
-        result[withdraw_key] = TxEventSettings(
-            taxable=False,
-            count_entire_amount_spend=False,
-            count_cost_basis_pnl=False,
-            take=1,
-            method='acquisition',
-        )
         return result
 
     def reset(self) -> None:
         """Reset the state of all initialized submodule accountants"""
-        for accountant in self.accountants.values():
+        for accountant in self._accountants_tuple:
             accountant.reset()
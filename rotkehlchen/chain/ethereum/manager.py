@@ -1,6 +1,7 @@
 import json
 import logging
 import random
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -76,7 +77,7 @@ from rotkehlchen.types import (
     Timestamp,
 )
 from rotkehlchen.user_messages import MessagesAggregator
-from rotkehlchen.utils.misc import from_wei, get_chunks, hex_or_bytes_to_str
+from rotkehlchen.utils.misc import from_wei, get_chunks, hex_or_bytes_to_str, ts_now
 from rotkehlchen.utils.network import request_get_dict
 
 from .constants import ETHERSCAN_NODE
@@ -113,6 +114,9 @@ def _is_synchronized(current_block: int, latest_block: int) -> Tuple[bool, str]:
 WEB3_LOGQUERY_BLOCK_RANGE = 250000
 
 MAX_ADDRESSES_IN_REVERSE_ENS_QUERY = 80
+BLOCK_TIMESTAMPS_CACHE_SIZE = 1024
+# Blocks older than this are considered final, so their timestamp is safe to cache
+BLOCK_FINALITY_SECS = 900
 
 
 def _query_web3_get_logs(
@@ -225,6 +229,9 @@ class EthereumManager():
                 'decimals': 18,
             },
         }
+        # A bounded LRU cache of final block timestamps so events in the same block
+        # do not requery it
+        self.block_timestamps_cache: 'OrderedDict[int, Timestamp]' = OrderedDict()
         self.database = database
 
     def connected_to_any_web3(self) -> bool:
@@ -1097,8 +1104,19 @@ class EthereumManager():
 
         # event from web3
         block_number = event['blockNumber']
+        timestamp = self.block_timestamps_cache.get(block_number)
+        if timestamp is not None:
+            self.block_timestamps_cache.move_to_end(block_number)
+            return timestamp
+
         block_data = self.get_block_by_number(block_number)
-        return Timestamp(block_data['timestamp'])
+        timestamp = Timestamp(block_data['timestamp'])
+        if ts_now() - timestamp > BLOCK_FINALITY_SECS:  # only cache blocks that can't reorg
+            self.block_timestamps_cache[block_number] = timestamp
+            if len(self.block_timestamps_cache) > BLOCK_TIMESTAMPS_CACHE_SIZE:
+                self.block_timestamps_cache.popitem(last=False)
+
+        return timestamp
 
     def _get_blocknumber_by_time_from_subgraph(self, ts: Timestamp) -> int:
         """Queries Ethereum Blocks Subgraph for closest block at or before given timestamp"""
@@ -1,14 +1,22 @@
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+import gevent
 
 from rotkehlchen.accounting.structures.balance import Balance
-from rotkehlchen.assets.asset import Asset
+from rotkehlchen.assets.asset import Asset, EvmToken
+from rotkehlchen.chain.ethereum.contracts import EthereumContract
 from rotkehlchen.chain.ethereum.graph import Graph
 from rotkehlchen.chain.ethereum.modules.makerdao.constants import RAY
-from rotkehlchen.chain.ethereum.utils import ethaddress_to_asset, token_normalized_value_decimals
+from rotkehlchen.chain.ethereum.utils import (
+    ethaddress_to_asset,
+    multicall,
+    token_normalized_value_decimals,
+)
 from rotkehlchen.constants.ethereum import ATOKEN_ABI, ATOKEN_V2_ABI
 from rotkehlchen.constants.misc import ZERO
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.price import query_usd_price_zero_if_error
@@ -297,10 +305,18 @@ def _parse_common_event_data(
 
 def _parse_atoken_balance_history(
         history: List[Dict[str, Any]],
+        reserve_address: ChecksumEvmAddress,
         from_ts: Timestamp,
         to_ts: Timestamp,
 ) -> List[ATokenBalanceHistory]:
-    result = []
+    """Parses the aTokenBalanceHistory entries of a single reserve"""
+    result: List[ATokenBalanceHistory] = []
+    # All entries belong to the given reserve so resolve its decimals only once
+    reserve_result = _get_reserve_address_asset_and_decimals(reserve_address)
+    if reserve_result is None:
+        return result
+    _, decimals = reserve_result
+
     for entry in history:
         timestamp = entry['timestamp']
         if timestamp < from_ts or timestamp > to_ts:
@@ -315,15 +331,6 @@ def _parse_atoken_balance_history(
             )
             continue
 
-        try:
-            address_s = '0x' + pairs[2]
-            reserve_address = deserialize_ethereum_address(address_s)
-        except DeserializationError:
-            log.error(
-                f'Error deserializing reserve address {address_s}',
-            )
-            continue
-
         try:
             tx_hash = deserialize_evm_tx_hash(pairs[4])
         except DeserializationError:
@@ -333,15 +340,6 @@ def _parse_atoken_balance_history(
             continue
 
         version = _get_version_from_reserveid(pairs, 3)
-        asset = ethaddress_to_asset(reserve_address)
-        if asset is None:
-            log.error(
-                f'Unknown aave reserve address returned by atoken balance history '
-                f' graph query: {reserve_address}. Skipping entry ...',
-            )
-            continue
-
-        _, decimals = _get_reserve_address_decimals(asset)
         if 'currentATokenBalance' in entry:
             balance = token_normalized_value_decimals(
                 int(entry['currentATokenBalance']),
@@ -374,6 +372,12 @@ def _get_reserve_asset_and_decimals(
         log.error(f'Failed to Deserialize reserve address {entry[reserve_key]["id"]}')
         return None
 
+    return _get_reserve_address_asset_and_decimals(reserve_address)
+
+
+def _get_reserve_address_asset_and_decimals(
+        reserve_address: ChecksumEvmAddress,
+) -> Optional[Tuple[Asset, int]]:
     asset = ethaddress_to_asset(reserve_address)
     if asset is None:
         log.error(
@@ -386,6 +390,24 @@ def _get_reserve_asset_and_decimals(
     return asset, decimals
 
 
+def _query_graph(
+        graph: Graph,
+        querystr: str,
+        param_types: Optional[Dict[str, Any]],
+        param_values: Optional[Dict[str, Any]],
+) -> Union[Dict[str, Any], RemoteError]:
+    """Queries a subgraph, returning a RemoteError instead of raising it so that
+    it can be re-raised by the caller and not kill the greenlet this runs in"""
+    try:
+        return graph.query(
+            querystr=querystr,
+            param_types=param_types,
+            param_values=param_values,
+        )
+    except RemoteError as e:
+        return e
+
+
 class AaveGraphInquirer(AaveInquirer):
     """Reads Aave historical data from the graph protocol"""
 
@@ -405,6 +427,8 @@ class AaveGraphInquirer(AaveInquirer):
         )
         self.graph = Graph('https://api.thegraph.com/subgraphs/name/aave/protocol-multy-raw')
         self.graph_v2 = Graph('https://api.thegraph.com/subgraphs/name/aave/protocol-v2')
+        # asset to aToken mappings resolved during a history query. Cleared after it
+        self.atokens_cache: Dict[Tuple[Asset, int], Optional[EvmToken]] = {}
 
     def get_history_for_addresses(
             self,
@@ -421,25 +445,65 @@ class AaveGraphInquirer(AaveInquirer):
         semaphore
         """
         result = {}
-        for address in addresses:
-            history_results = self.get_history_for_address(
-                user_address=address,
-                from_timestamp=from_timestamp,
-                to_timestamp=to_timestamp,
-                balances=aave_balances.get(address, AaveBalances({}, {})),
-            )
-            if history_results is None:
-                continue
-            result[address] = history_results
+        try:
+            for address in addresses:
+                history_results = self.get_history_for_address(
+                    user_address=address,
+                    from_timestamp=from_timestamp,
+                    to_timestamp=to_timestamp,
+                    balances=aave_balances.get(address, AaveBalances({}, {})),
+                )
+                if history_results is None:
+                    continue
+                result[address] = history_results
+        finally:
+            # the aToken mappings are only valid for the duration of this query
+            self.atokens_cache.clear()
 
         return result
 
+    def _query_graphs(
+            self,
+            querystr: str,
+            querystr_v2: str,
+            param_types: Optional[Dict[str, Any]] = None,
+            param_values: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Queries the v1 and v2 subgraphs concurrently since the queries are independent
+
+        May raise:
+        - RemoteError if any of the subgraph queries fails
+        """
+        greenlets = [
+            gevent.spawn(
+                _query_graph,
+                graph=graph,
+                querystr=query,
+                param_types=param_types,
+                param_values=param_values,
+            )
+            for graph, query in ((self.graph, querystr), (self.graph_v2, querystr_v2))
+        ]
+        gevent.joinall(greenlets)
+        query, query_v2 = greenlets[0].get(), greenlets[1].get()
+        if isinstance(query, RemoteError):
+            raise query
+        if isinstance(query_v2, RemoteError):
+            raise query_v2
+        return query, query_v2
+
+    def _asset_to_atoken(self, asset: Asset, version: int) -> Optional[EvmToken]:
+        """Memoized asset_to_atoken() so that the DB is only queried once per
+        asset and version instead of once per event during a history query"""
+        key = (asset, version)
+        if key not in self.atokens_cache:
+            self.atokens_cache[key] = asset_to_atoken(asset=asset, version=version)
+        return self.atokens_cache[key]
+
     def _get_user_reserves(self, address: ChecksumEvmAddress) -> List[AaveUserReserve]:
-        query = self.graph.query(
-            querystr=USER_RESERVES_QUERY.format(address=address.lower()),
-        )
-        query_v2 = self.graph_v2.query(
+        query, query_v2 = self._query_graphs(
             querystr=USER_RESERVES_QUERY.format(address=address.lower()),
+            querystr_v2=USER_RESERVES_QUERY.format(address=address.lower()),
         )
         result = []
         for entry in query['userReserves'] + query_v2['userReserves']:
@@ -491,9 +555,12 @@ class AaveGraphInquirer(AaveInquirer):
 
             atoken_history = _parse_atoken_balance_history(
                 history=reserve['aTokenBalanceHistory'],
+                reserve_address=reserve_address,
                 from_ts=from_ts,
                 to_ts=to_ts,
             )
+            # sort once here instead of for every action that uses this history
+            atoken_history.sort(key=lambda event: event.timestamp)
             reserve_history[reserve_address] = atoken_history
 
         interest_events: List[AaveInterestEvent] = []
@@ -505,6 +572,11 @@ class AaveGraphInquirer(AaveInquirer):
         for interest_event in db_interest_events:
             total_earned[interest_event.asset] += interest_event.value
 
+        # Resolve the reserve address of each action asset once, not once per action
+        reserve_addresses = {
+            asset: asset_to_aave_reserve_address(asset)
+            for asset in {action.asset for action in actions}
+        }
         # Create all new interest events in the query
         actions.sort(key=lambda event: event.timestamp)
         for action in actions:
@@ -513,7 +585,7 @@ class AaveGraphInquirer(AaveInquirer):
             else:  # withdrawal
                 atoken_balances[action.asset] -= action.value.amount
 
-            action_reserve_address = asset_to_aave_reserve_address(action.asset)
+            action_reserve_address = reserve_addresses[action.asset]
             if action_reserve_address is None:
                 log.error(
                     f'Could not find aave reserve address for asset'
@@ -529,7 +601,6 @@ class AaveGraphInquirer(AaveInquirer):
                     f' Skipping entry...',
                 )
                 continue
-            history.sort(key=lambda event: event.timestamp)
 
             for idx, entry in enumerate(history):
                 if idx in used_history_indices:
@@ -540,7 +611,7 @@ class AaveGraphInquirer(AaveInquirer):
                     diff = entry.balance - atoken_balances[action.asset]
                     if diff != ZERO:
                         atoken_balances[action.asset] = entry.balance
-                        asset = asset_to_atoken(asset=action.asset, version=entry.version)
+                        asset = self._asset_to_atoken(asset=action.asset, version=entry.version)
                         if asset is None:
                             log.error(
                                 f'Could not find corresponding aToken to '
@@ -590,9 +661,11 @@ class AaveGraphInquirer(AaveInquirer):
                 else:  # withdrawal
                     atoken_balances[action.asset] -= action.value.amount
 
-        # Take aave unpaid interest into account
+        # Take aave unpaid interest into account. Principal balances of all
+        # aTokens are queried in a single multicall instead of one call per aToken
+        unpaid_interest_queries = []
         for balance_asset, lending_balance in balances.lending.items():
-            atoken = asset_to_atoken(balance_asset, version=lending_balance.version)
+            atoken = self._asset_to_atoken(balance_asset, version=lending_balance.version)
             if atoken is None:
                 log.error(
                     f'Could not find corresponding v{lending_balance.version} aToken to '
@@ -608,13 +681,26 @@ class AaveGraphInquirer(AaveInquirer):
                 method = 'scaledBalanceOf'
                 abi = ATOKEN_V2_ABI
 
-            principal_balance = self.ethereum.call_contract(
-                contract_address=atoken.evm_address,
-                abi=abi,
-                method_name=method,
+            contract = EthereumContract(address=atoken.evm_address, abi=abi, deployed_block=0)
+            unpaid_interest_queries.append((lending_balance, atoken, contract, method))
+
+        output = multicall(
+            ethereum=self.ethereum,
+            calls=[
+                (contract.address, contract.encode(method_name=method, arguments=[user_address]))
+                for _, _, contract, method in unpaid_interest_queries
+            ],
+        )
+        for (lending_balance, atoken, contract, method), result_encoded in zip(unpaid_interest_queries, output):  # noqa: E501
+            principal_balance = contract.decode(
+                result_encoded,
+                method,
                 arguments=[user_address],
+            )[0]
+            unpaid_interest = lending_balance.balance.amount - token_normalized_value_decimals(
+                token_amount=principal_balance,
+                token_decimals=atoken.decimals,
             )
-            unpaid_interest = lending_balance.balance.amount - (principal_balance / (FVal(10) ** FVal(atoken.decimals)))  # noqa: E501
             usd_price = Inquirer().find_usd_price(atoken)
             total_earned[atoken] += Balance(
                 amount=unpaid_interest,
@@ -749,13 +835,9 @@ class AaveGraphInquirer(AaveInquirer):
         borrows: List[AaveBorrowEvent] = []
         repays: List[AaveRepayEvent] = []
         liquidation_calls: List[AaveLiquidationEvent] = []
-        query = self.graph.query(
+        query, query_v2 = self._query_graphs(
             querystr=USER_EVENTS_QUERY,
-            param_types={'$address': 'ID!'},
-            param_values={'address': address.lower()},
-        )
-        query_v2 = self.graph_v2.query(
-            querystr=USER_EVENTS_QUERY_V2,
+            querystr_v2=USER_EVENTS_QUERY_V2,
             param_types={'$address': 'ID!'},
             param_values={'address': address.lower()},
         )
@@ -859,7 +941,7 @@ class AaveGraphInquirer(AaveInquirer):
 
             version = _get_version_from_reserveid(pairs, 2)
             asset, balance = result
-            atoken = asset_to_atoken(asset=asset, version=version)
+            atoken = self._asset_to_atoken(asset=asset, version=version)
             if atoken is None:
                 log.error(
                     f'Could not find a v{version} aToken for asset {asset} during aave deposit',
@@ -911,7 +993,7 @@ class AaveGraphInquirer(AaveInquirer):
 
             version = _get_version_from_reserveid(pairs, 2)
             asset, balance = result
-            atoken = asset_to_atoken(asset=asset, version=version)
+            atoken = self._asset_to_atoken(asset=asset, version=version)
             if atoken is None:
                 log.error(
                     f'Could not find a v{version} aToken for asset {asset} during aave withdraw',
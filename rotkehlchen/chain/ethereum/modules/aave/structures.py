@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, Dict, Literal, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.asset import Asset, EvmToken
@@ -29,7 +29,10 @@ AAVE_EVENT_DB_TUPLE = Tuple[
 
 @dataclasses.dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
 class AaveEvent:
-    """An event of the Aave protocol"""
+    """An event of the Aave protocol
+
+    Uses slots since a lot of these events can be created for a single address"""
+    __slots__ = ('event_type', 'block_number', 'timestamp', 'tx_hash', 'log_index')
     event_type: AAVE_EVENT_TYPE
     # for events coming from Graph this is not retrievable
     # Because of this "TODO":
@@ -74,10 +77,19 @@ class AaveEvent:
         """Used in DefiEvent processing during accounting"""
         return f'Aave {self.event_type} event'
 
+    def __getstate__(self) -> List[Any]:
+        """Frozen dataclasses with slots can't be copied/pickled by setting attributes"""
+        return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        for field, value in zip(dataclasses.fields(self), state):
+            object.__setattr__(self, field.name, value)
+
 
 @dataclasses.dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
 class AaveInterestEvent(AaveEvent):
     """A simple event of the Aave protocol. Deposit, withdrawal or interest"""
+    __slots__ = ('asset', 'value')
     asset: Asset
     value: Balance
 
@@ -102,6 +114,7 @@ class AaveInterestEvent(AaveEvent):
 @dataclasses.dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
 class AaveDepositWithdrawalEvent(AaveEvent):
     """A deposit or withdrawal in the aave protocol"""
+    __slots__ = ('asset', 'value', 'atoken')
     asset: Asset
     value: Balance
     atoken: EvmToken
@@ -128,6 +141,7 @@ class AaveDepositWithdrawalEvent(AaveEvent):
 @dataclasses.dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
 class AaveBorrowEvent(AaveInterestEvent):
     """A borrow event of the Aave protocol"""
+    __slots__ = ('borrow_rate_mode', 'borrow_rate', 'accrued_borrow_interest')
     borrow_rate_mode: Literal['stable', 'variable']
     borrow_rate: FVal
     accrued_borrow_interest: FVal
@@ -148,6 +162,7 @@ class AaveBorrowEvent(AaveInterestEvent):
 @dataclasses.dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
 class AaveRepayEvent(AaveInterestEvent):
     """A repay event of the Aave protocol"""
+    __slots__ = ('fee',)
     fee: Balance
 
     def to_db_tuple(self, address: ChecksumEvmAddress) -> AAVE_EVENT_DB_TUPLE:  # type: ignore
@@ -166,6 +181,7 @@ class AaveRepayEvent(AaveInterestEvent):
 @dataclasses.dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
 class AaveLiquidationEvent(AaveEvent):
     """An aave liquidation event. You gain the principal and lose the collateral."""
+    __slots__ = ('collateral_asset', 'collateral_balance', 'principal_asset', 'principal_balance')  # noqa: E501
     collateral_asset: Asset
     collateral_balance: Balance
     principal_asset: Asset
@@ -80,7 +80,13 @@ from rotkehlchen.premium.premium import Premium
 from rotkehlchen.serialization.deserialize import deserialize_ethereum_address
 from rotkehlchen.types import ChecksumEvmAddress, EVMTxHash, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
-from rotkehlchen.utils.misc import address_to_bytes32, hexstr_to_int, shift_num_right_by, ts_now
+from rotkehlchen.utils.misc import (
+    address_to_bytes32,
+    hex_or_bytes_to_int,
+    hexstr_to_int,
+    shift_num_right_by,
+    ts_now,
+)
 
 from .constants import MAKERDAO_REQUERY_PERIOD, RAY, WAD
 
@@ -593,7 +599,7 @@ class MakerdaoVaults(HasDSProxy):
             else:  # bytes
                 lot = event['data'][:32]
             amount = asset_normalized_value(
-                amount=hexstr_to_int(lot),
+                amount=hex_or_bytes_to_int(lot),
                 asset=vault.collateral_asset,
             )
             timestamp = self.ethereum.get_event_timestamp(event)
@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from eth_utils import to_checksum_address
 from web3 import Web3
@@ -53,20 +53,30 @@ ENS_RESOLVER_ABI_MULTICHAIN_ADDRESS = [
     },
 ]
 MULTICALL_CHUNKS = 20
+# Cache of 10 ** decimals to not recompute the exponentiation for every token amount
+DECIMALS_SCALE: Dict[int, FVal] = {x: FVal(10) ** FVal(x) for x in (0, 6, 8, 18)}
+
+
+def decimals_scale(decimals: int) -> FVal:
+    """Returns 10 ** decimals as an FVal, memoized per number of decimals"""
+    scale = DECIMALS_SCALE.get(decimals)
+    if scale is None:
+        scale = DECIMALS_SCALE[decimals] = FVal(10) ** FVal(decimals)
+    return scale
 
 
 def token_normalized_value_decimals(token_amount: int, token_decimals: Optional[int]) -> FVal:
     if token_decimals is None:  # if somehow no info on decimals ends up here assume 18
         token_decimals = 18
 
-    return token_amount / (FVal(10) ** FVal(token_decimals))
+    return token_amount / decimals_scale(token_decimals)
 
 
 def token_raw_value_decimals(token_amount: FVal, token_decimals: Optional[int]) -> int:
     if token_decimals is None:  # if somehow no info on decimals ends up here assume 18
         token_decimals = 18
 
-    return (token_amount * (FVal(10) ** FVal(token_decimals))).to_int(exact=False)
+    return (token_amount * decimals_scale(token_decimals)).to_int(exact=False)
 
 
 def token_normalized_value(
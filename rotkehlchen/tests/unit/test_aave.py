@@ -1,13 +1,35 @@
+from unittest.mock import patch
+
+import pytest
+
+from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.asset import EvmToken
 from rotkehlchen.chain.ethereum.modules.aave.common import (
+    AaveBalances,
+    AaveLendingBalance,
     asset_to_aave_reserve_address,
+    asset_to_atoken,
     atoken_to_asset,
 )
+from rotkehlchen.chain.ethereum.modules.aave.graph import AaveGraphInquirer
 from rotkehlchen.chain.ethereum.utils import ethaddress_to_asset
-from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.constants.assets import A_DAI, A_ETH, A_USDC
 from rotkehlchen.constants.ethereum import ETH_SPECIAL_ADDRESS
+from rotkehlchen.errors.misc import RemoteError
+from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.tests.utils.aave import ATOKENV1_TO_ASSET, ATOKENV2_ADDRESS_TO_RESERVE_ASSET
+from rotkehlchen.tests.utils.factories import make_ethereum_address
+
+
+@pytest.fixture(name='aave_graph_inquirer')
+def fixture_aave_graph_inquirer(ethereum_manager, database, function_scope_messages_aggregator):
+    return AaveGraphInquirer(
+        ethereum_manager=ethereum_manager,
+        database=database,
+        msg_aggregator=function_scope_messages_aggregator,
+        premium=None,
+    )
 
 
 def test_aave_reserve_mapping():
@@ -39,3 +61,71 @@ def test_atoken_to_asset():
 
     for atokenv1, reserve_asset in ATOKENV1_TO_ASSET.items():
         assert atoken_to_asset(atokenv1) == reserve_asset
+
+
+def test_aave_graph_query_remote_error(aave_graph_inquirer):
+    """Test that a failing subgraph query during the concurrent v1/v2
+    queries raises the RemoteError to the caller"""
+    v1_patch = patch.object(
+        aave_graph_inquirer.graph,
+        'query',
+        return_value={'userReserves': []},
+    )
+    v2_patch = patch.object(
+        aave_graph_inquirer.graph_v2,
+        'query',
+        side_effect=RemoteError('subgraph is down'),
+    )
+    with v1_patch, v2_patch, pytest.raises(RemoteError, match='subgraph is down'):
+        aave_graph_inquirer._get_user_reserves(make_ethereum_address())
+
+
+def test_aave_graph_unpaid_interest(aave_graph_inquirer):
+    """Test that the principal balances of all aTokens are queried in one multicall
+    and that the unpaid interest is computed per aToken"""
+    user_address = make_ethereum_address()
+    balances = AaveBalances(
+        lending={
+            A_DAI: AaveLendingBalance(
+                balance=Balance(amount=FVal('110'), usd_value=FVal('110')),
+                apy=FVal('0.05'),
+                version=1,
+            ),
+            A_USDC: AaveLendingBalance(
+                balance=Balance(amount=FVal('52.5'), usd_value=FVal('52.5')),
+                apy=FVal('0.03'),
+                version=2,
+            ),
+        },
+        borrowing={},
+    )
+    principal_balances = [
+        (100 * 10 ** 18).to_bytes(32, byteorder='big'),  # aDAI v1 has 18 decimals
+        (50 * 10 ** 6).to_bytes(32, byteorder='big'),  # aUSDC v2 has 6 decimals
+    ]
+    multicall_patch = patch(
+        'rotkehlchen.chain.ethereum.modules.aave.graph.multicall',
+        return_value=principal_balances,
+    )
+    price_patch = patch(
+        'rotkehlchen.chain.ethereum.modules.aave.graph.Inquirer.find_usd_price',
+        return_value=FVal('2'),
+    )
+    with multicall_patch as multicall_mock, price_patch:
+        interest_events, total_earned = aave_graph_inquirer._calculate_interest_and_profit(
+            user_address=user_address,
+            user_result={'reserves': []},
+            actions=[],
+            balances=balances,
+            db_interest_events=set(),
+            from_ts=0,
+            to_ts=1600000000,
+        )
+
+    assert multicall_mock.call_count == 1
+    assert len(multicall_mock.call_args.kwargs['calls']) == 2
+    assert interest_events == []
+    assert total_earned == {
+        asset_to_atoken(A_DAI, version=1): Balance(amount=FVal('10'), usd_value=FVal('20')),
+        asset_to_atoken(A_USDC, version=2): Balance(amount=FVal('2.5'), usd_value=FVal('5')),
+    }
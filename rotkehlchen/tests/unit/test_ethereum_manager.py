@@ -1,4 +1,5 @@
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -312,3 +313,21 @@ def test_get_blocknumber_by_time_subgraph(ethereum_manager):
 def test_get_blocknumber_by_time_etherscan(ethereum_manager):
     """Queries etherscan for known block times"""
     _test_get_blocknumber_by_time(ethereum_manager, True)
+
+
+def test_get_event_timestamp_caches_block(ethereum_manager):
+    """Test that web3 events in the same block only query the block once"""
+    events = [
+        {'blockNumber': 10304885, 'logIndex': 1},
+        {'blockNumber': 10304885, 'logIndex': 2},
+    ]
+    block_patch = patch.object(
+        ethereum_manager,
+        'get_block_by_number',
+        return_value={'timestamp': 1592686213, 'number': 10304885},
+    )
+    with block_patch as block_mock:
+        for event in events:
+            assert ethereum_manager.get_event_timestamp(event) == 1592686213
+
+    assert block_mock.call_count == 1
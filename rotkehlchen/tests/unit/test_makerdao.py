@@ -1,4 +1,5 @@
 from collections import defaultdict
+from unittest.mock import patch
 
 import pytest
 from web3 import Web3
@@ -158,3 +159,39 @@ def test_vault_types():
             continue
 
         assert asset.symbol.lower() == collateral_type.split('-')[0].lower()
+
+
+@pytest.mark.parametrize('number_of_eth_accounts', [2])
+def test_vault_liquidation_bytes_data(makerdao_vaults, makerdao_test_data):
+    """Test that a Bite event whose log data is bytes gets its liquidated lot decoded"""
+    vault = makerdao_test_data.vaults[0]
+    bite_event = {
+        'transactionHash': '0x' + 'ab' * 32,
+        'blockNumber': 10000000,
+        'timeStamp': 1600000000,
+        # lot (1.5 ETH) followed by art
+        'data': (15 * 10**17).to_bytes(32, 'big') + (500 * 10**18).to_bytes(32, 'big'),
+    }
+
+    def mock_get_logs(event_name, **kwargs):  # pylint: disable=unused-argument
+        if event_name == 'NewCdp':
+            return [{'transactionHash': '0x' + 'cd' * 32, 'timeStamp': 1500000000}]
+        if event_name == 'Bite':
+            return [bite_event]
+        return []
+
+    get_logs_patch = patch.object(makerdao_vaults.ethereum, 'get_logs', side_effect=mock_get_logs)
+    price_patch = patch(
+        'rotkehlchen.chain.ethereum.modules.makerdao.vaults.query_usd_price_or_use_default',
+        return_value=FVal('100'),
+    )
+    with get_logs_patch, price_patch:
+        details = makerdao_vaults._query_vault_details(
+            vault=vault,
+            proxy=makerdao_test_data.proxy_mappings[vault.owner],
+            urn=vault.urn,
+        )
+
+    assert details.total_liquidated == Balance(FVal('1.5'), FVal('150'))
+    assert len(details.events) == 1
+    assert details.events[0].value == Balance(FVal('1.5'), FVal('150'))